@@ -2,23 +2,116 @@
 OptiFlow Backend - Flask Application
 Project Management Tool with Gantt Chart Visualization
 """
-from flask import Flask, jsonify, request
+from flask import Flask, Response, abort, g, jsonify, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
-from datetime import datetime
+from flask_compress import Compress
+from sqlalchemy import bindparam, event, func, literal, select, union_all, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from datetime import datetime, date
+import hashlib
+import orjson
 import os
+import queue
+import threading
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for fast response serialization"""
+
+    # orjson always emits compact, insertion-ordered JSON; pin the provider
+    # settings to match so a fallback to the stdlib encoder behaves the same
+    sort_keys = False
+    compact = True
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+            default=self.default
+        ).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    @staticmethod
+    def default(obj):
+        if isinstance(obj, (date, datetime)):
+            return obj.isoformat()
+        raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+app.config['JSONIFY_PRETTYPRINT_REGULAR'] = False
+# Compress JSON responses when the client advertises support; skip tiny
+# payloads where the compression overhead outweighs the byte savings
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 500
+Compress(app)
 CORS(app, resources={r"/api/*": {"origins": "*", "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"], "allow_headers": ["Content-Type"]}})
 
 # Configure SQLite database
 basedir = os.path.abspath(os.path.dirname(__file__))
 app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.join(basedir, "optiflow.db")}'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Keep a pool of warm connections instead of paying connection setup (and
+# the pragma hook below) per request. With WAL mode and check_same_thread
+# off, the SQLite file is safe to share across pooled connections; the
+# busy timeout covers brief writer contention.
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': 10,
+    'max_overflow': 20,
+    'pool_pre_ping': False,
+    'pool_recycle': -1,
+    'connect_args': {'check_same_thread': False, 'timeout': 15},
+}
 
 db = SQLAlchemy(app)
 
+
+# GET endpoints whose payloads change rarely; clients may reuse them briefly
+# without revalidating
+_CACHEABLE_PATHS = ('/api/settings', '/api/resources', '/api/statuses', '/api/task-types')
+
+
+@app.after_request
+def _add_etag(response):
+    """
+    Tag successful GET responses with a strong ETag and answer 304 Not
+    Modified when the client already holds the current payload, skipping the
+    response body entirely on poll traffic.
+    """
+    if (request.method == 'GET' and response.status_code == 200
+            and not response.direct_passthrough and not response.is_streamed):
+        etag = hashlib.blake2b(response.get_data(), digest_size=16).hexdigest()
+        response.set_etag(etag)
+        if request.path in _CACHEABLE_PATHS:
+            response.headers['Cache-Control'] = 'private, max-age=30'
+        return response.make_conditional(request)
+    return response
+
+
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """
+    Tune SQLite on every new connection: WAL avoids a rollback-journal fsync
+    per commit and lets readers run alongside writers, NORMAL sync is safe in
+    WAL mode, and the cache/temp settings keep hot pages and sorts in memory.
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA cache_size=-65536')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
+
+
 # =============================================================================
 # DATABASE MODELS
 # =============================================================================
@@ -30,28 +123,48 @@ class Project(db.Model):
     description = db.Column(db.Text)
     code = db.Column(db.String(10), unique=True, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    tasks = db.relationship('Task', backref='project', lazy=True, cascade='all, delete-orphan')
-
-    def to_dict(self):
-        # Calculate summary statistics from tasks
-        tasks = self.tasks
-        total_estimate = sum(t.estimate or 0 for t in tasks)
-        completed_estimate = sum((t.estimate or 0) * (t.progress or 0) / 100 for t in tasks)
+    next_task_seq = db.Column(db.Integer, default=0)  # Counter for task ID generation
+    # passive_deletes keeps session.delete(project) from loading every task
+    # just to delete it; delete_project bulk-deletes the rows itself and the
+    # ON DELETE CASCADE foreign key backstops any other path.
+    tasks = db.relationship('Task', backref='project', lazy=True,
+                            cascade='all, delete-orphan', passive_deletes=True)
+
+    @classmethod
+    def task_summaries(cls, project_id=None):
+        """
+        Aggregate task statistics per project in a single grouped query.
+        Returns {project_id: (task_count, total_estimate, completed_estimate, start, end)}.
+        """
+        query = db.session.query(
+            Task.project_id,
+            func.count(Task.id),
+            func.sum(Task.estimate),
+            func.sum(Task.estimate * Task.progress / 100.0),
+            func.min(Task.start_date),
+            func.max(Task.end_date)
+        ).group_by(Task.project_id)
+        if project_id is not None:
+            query = query.filter(Task.project_id == project_id)
+        return {row[0]: tuple(row[1:]) for row in query.all()}
+
+    def to_dict(self, summary=None):
+        # Summary statistics are aggregated in SQL rather than by iterating self.tasks
+        if summary is None:
+            summary = Project.task_summaries(self.id).get(self.id)
+        task_count, total_estimate, completed_estimate, project_start, project_end = \
+            summary or (0, None, None, None, None)
+        total_estimate = total_estimate or 0
+        completed_estimate = completed_estimate or 0
         progress = round(completed_estimate / total_estimate * 100) if total_estimate > 0 else 0
-        
-        # Calculate date range
-        start_dates = [t.start_date for t in tasks if t.start_date]
-        end_dates = [t.end_date for t in tasks if t.end_date]
-        project_start = min(start_dates).isoformat() if start_dates else None
-        project_end = max(end_dates).isoformat() if end_dates else None
-        
+
         return {
             'id': self.id,
             'name': self.name,
             'description': self.description,
             'code': self.code,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'task_count': len(tasks),
+            'created_at': self.created_at,
+            'task_count': task_count,
             'total_estimate': round(total_estimate, 1),
             'completed_estimate': round(completed_estimate, 1),
             'progress': progress,
@@ -72,8 +185,8 @@ class Task(db.Model):
     status = db.Column(db.String(50), default='Not Started')
     task_type = db.Column(db.String(20), default='Task')  # Task or Milestone
     parent_ids = db.Column(db.String(200))  # Comma-separated dependency task IDs (predecessors)
-    progress = db.Column(db.Integer, default=0)  # Progress percentage 0-100
-    project_id = db.Column(db.Integer, db.ForeignKey('project.id'), nullable=False)
+    progress = db.Column(db.Integer, default=0, nullable=False)  # Progress percentage 0-100
+    project_id = db.Column(db.Integer, db.ForeignKey('project.id', ondelete='CASCADE'), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     order_index = db.Column(db.Integer, default=0)
     
@@ -85,29 +198,67 @@ class Task(db.Model):
     expanded = db.Column(db.Boolean, default=True)  # UI collapse/expand state
     
     # Self-referential relationship for hierarchy
-    children = db.relationship('Task', backref=db.backref('parent', remote_side=[id]), lazy='dynamic')
+    children = db.relationship('Task', back_populates='parent', lazy='select')
+    parent = db.relationship('Task', back_populates='children', remote_side=[id])
+
+    # Composite indexes for the hot query paths: per-project ordered listings
+    # and parent/child lookups during hierarchy recalculation
+    __table_args__ = (
+        db.Index('ix_task_project_order', 'project_id', 'order_index'),
+        db.Index('ix_task_project_parent', 'project_id', 'parent_id'),
+        db.Index('ix_task_parent', 'parent_id'),
+        db.CheckConstraint('progress BETWEEN 0 AND 100', name='ck_task_progress'),
+    )
+
+    # Serialized column names, computed once on first use (created_at is
+    # internal and excluded, matching the list readers)
+    _serialized_cols = None
 
     def to_dict(self):
-        return {
-            'id': self.id,
-            'task_id': self.task_id,
-            'description': self.description,
-            'start_date': self.start_date.isoformat() if self.start_date else None,
-            'end_date': self.end_date.isoformat() if self.end_date else None,
-            'estimate': self.estimate,
-            'resource': self.resource,
-            'status': self.status,
-            'task_type': self.task_type,
-            'parent_ids': self.parent_ids,
-            'progress': self.progress or 0,
-            'project_id': self.project_id,
-            'order_index': self.order_index,
-            'parent_id': self.parent_id,
-            'level': self.level or 0,
-            'wbs_code': self.wbs_code,
-            'is_summary': self.is_summary or False,
-            'expanded': self.expanded if self.expanded is not None else True
-        }
+        cols = Task._serialized_cols
+        if cols is None:
+            cols = Task._serialized_cols = \
+                [c.name for c in Task.__table__.columns if c.name != 'created_at']
+        # Read loaded values straight from __dict__, bypassing the
+        # instrumented descriptors; getattr only fires for expired/deferred
+        # attributes, where it triggers the usual load
+        state = self.__dict__
+        d = {c: state[c] if c in state else getattr(self, c) for c in cols}
+        d['progress'] = d['progress'] or 0
+        d['level'] = d['level'] or 0
+        d['is_summary'] = d['is_summary'] or False
+        if d['expanded'] is None:
+            d['expanded'] = True
+        return d
+
+    @staticmethod
+    def rows_to_dicts(rows):
+        """
+        Batch-serialize an already-loaded task list for the list endpoints.
+        One dict literal per row with no per-field None guards on the NOT
+        NULL columns keeps the Python overhead minimal on large responses;
+        dates stay raw and are encoded natively by the JSON provider.
+        """
+        return [{
+            'id': t.id,
+            'task_id': t.task_id,
+            'description': t.description,
+            'start_date': t.start_date,
+            'end_date': t.end_date,
+            'estimate': t.estimate,
+            'resource': t.resource,
+            'status': t.status,
+            'task_type': t.task_type,
+            'parent_ids': t.parent_ids,
+            'progress': t.progress or 0,
+            'project_id': t.project_id,
+            'order_index': t.order_index,
+            'parent_id': t.parent_id,
+            'level': t.level or 0,
+            'wbs_code': t.wbs_code,
+            'is_summary': t.is_summary or False,
+            'expanded': t.expanded if t.expanded is not None else True
+        } for t in rows]
 
 
 class Resource(db.Model):
@@ -127,8 +278,8 @@ class Resource(db.Model):
             'name': self.name,
             'email': self.email,
             'color': self.color,
-            'availability_start': self.availability_start.isoformat() if self.availability_start else '2025-10-01',
-            'availability_end': self.availability_end.isoformat() if self.availability_end else '2026-01-30',
+            'availability_start': self.availability_start or '2025-10-01',
+            'availability_end': self.availability_end or '2026-01-30',
             'allocation_percent': self.allocation_percent if self.allocation_percent is not None else 100
         }
 
@@ -139,7 +290,7 @@ class Status(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(50), nullable=False)
     color = db.Column(db.String(7), nullable=False)
-    order_index = db.Column(db.Integer, default=0)
+    order_index = db.Column(db.Integer, default=0, index=True)
 
     def to_dict(self):
         return {
@@ -163,208 +314,351 @@ class TaskType(db.Model):
 
 
 # =============================================================================
-# API ROUTES - PROJECTS
+# ROW READERS (Core queries - list endpoints skip ORM instance hydration)
 # =============================================================================
 
+def _iter_task_rows(project_id):
+    """Yield a project's tasks as plain dicts in tree order, without ORM hydration."""
+    columns = [c for c in Task.__table__.c if c.name != 'created_at']
+    rows = db.session.execute(
+        select(*columns)
+        .where(Task.__table__.c.project_id == project_id)
+        .order_by(Task.__table__.c.order_index)
+        .execution_options(yield_per=500)
+    ).mappings()
+    for r in rows:
+        yield {**r,
+               'progress': r['progress'] or 0,
+               'level': r['level'] or 0,
+               'is_summary': r['is_summary'] or False,
+               'expanded': r['expanded'] if r['expanded'] is not None else True}
+
+
+def _resource_rows():
+    """Fetch all resources as plain dicts with availability defaults applied."""
+    rows = db.session.execute(select(Resource.__table__)).mappings()
+    return [{**r,
+             'availability_start': r['availability_start'] or '2025-10-01',
+             'availability_end': r['availability_end'] or '2026-01-30',
+             'allocation_percent': r['allocation_percent'] if r['allocation_percent'] is not None else 100}
+            for r in rows]
+
+
+def _status_rows():
+    """Fetch all statuses as plain dicts, ordered for display."""
+    rows = db.session.execute(
+        select(Status.__table__).order_by(Status.__table__.c.order_index)
+    ).mappings()
+    return [dict(r) for r in rows]
+
+
+def _task_type_rows():
+    """Fetch all task types as plain dicts."""
+    rows = db.session.execute(select(TaskType.__table__)).mappings()
+    return [dict(r) for r in rows]
+
+
+def _settings_rows():
+    """
+    Fetch resources, statuses and task types with a single UNION ALL
+    statement tagged by a kind column, then partition in Python. One
+    execute/result-parse instead of three for every /api/settings hit.
+    """
+    r = Resource.__table__.c
+    s = Status.__table__.c
+    t = TaskType.__table__.c
+    null = literal(None)
+    stmt = union_all(
+        select(literal('resource').label('kind'), r.id, r.name, r.email, r.color,
+               r.availability_start, r.availability_end, r.allocation_percent,
+               null.label('order_index')),
+        select(literal('status'), s.id, s.name, null, s.color,
+               null, null, null, s.order_index),
+        select(literal('task_type'), t.id, t.name, null, null,
+               null, null, null, null),
+    )
+
+    resources, statuses, task_types = [], [], []
+    for row in db.session.execute(stmt).mappings():
+        kind = row['kind']
+        if kind == 'resource':
+            resources.append({
+                'id': row['id'],
+                'name': row['name'],
+                'email': row['email'],
+                'color': row['color'],
+                'availability_start': row['availability_start'] or '2025-10-01',
+                'availability_end': row['availability_end'] or '2026-01-30',
+                'allocation_percent': row['allocation_percent'] if row['allocation_percent'] is not None else 100,
+            })
+        elif kind == 'status':
+            statuses.append({
+                'id': row['id'],
+                'name': row['name'],
+                'color': row['color'],
+                'order_index': row['order_index'],
+            })
+        else:
+            task_types.append({'id': row['id'], 'name': row['name']})
+
+    statuses.sort(key=lambda st: st['order_index'] or 0)
+    return resources, statuses, task_types
+
+
+# The settings collections are read on nearly every page load but change
+# only through their own write endpoints, so serialized payloads are cached
+# per version. Writers bump their collection's counter, which keys future
+# reads to a fresh cache entry; the process-local cache is wiped wholesale
+# if it ever accumulates too many stale versions.
+_settings_versions = {'resource': 0, 'status': 0, 'task_type': 0}
+_settings_cache = {}
+
+
+def _bump_settings_version(kind):
+    """Invalidate cached payloads that include the given settings collection."""
+    _settings_versions[kind] += 1
+
+
+def _cached_json(key, build):
+    """Return a JSON response for key from cache, building it on a miss."""
+    body = _settings_cache.get(key)
+    if body is None:
+        if len(_settings_cache) >= 16:
+            _settings_cache.clear()
+        body = _settings_cache[key] = orjson.dumps(build())
+    return Response(body, mimetype='application/json')
+
+
 # =============================================================================
 # HIERARCHY HELPER FUNCTIONS
 # =============================================================================
 
-def recalculate_summary_dates(project_id):
+def _require_project(project_id):
     """
-    Bottom-up recalculation of summary task dates.
-    For each summary task, compute:
-    - start_date = MIN(children.start_date)
-    - end_date = MAX(children.end_date)
-    - estimate = working days between start and end
+    404 unless the project exists. Cheaper than get_or_404 for endpoints that
+    only need the existence check: selects just the id column instead of
+    materializing the full Project row.
     """
-    tasks = Task.query.filter_by(project_id=project_id).all()
-    task_dict = {t.id: t for t in tasks}
-    
-    # Build parent-children map
-    children_map = {}
-    for t in tasks:
-        if t.parent_id:
-            if t.parent_id not in children_map:
-                children_map[t.parent_id] = []
-            children_map[t.parent_id].append(t)
-    
-    # Get all tasks that have children (summary tasks)
-    summary_ids = set(children_map.keys())
-    
-    # Process from deepest level up
-    def get_date_range(task_id):
-        """Recursively get min start and max end for a task including all descendants"""
-        task = task_dict.get(task_id)
-        if not task:
-            return None, None
-        
-        children = children_map.get(task_id, [])
-        if not children:
-            # Leaf task - return its own dates
-            return task.start_date, task.end_date
-        
-        # For summary tasks, calculate dates PURELY from children (not own dates)
-        min_start = None
-        max_end = None
-        
-        for child in children:
-            child_start, child_end = get_date_range(child.id)
-            if child_start:
-                if min_start is None or child_start < min_start:
-                    min_start = child_start
-            if child_end:
-                if max_end is None or child_end > max_end:
-                    max_end = child_end
-        
-        return min_start, max_end
-    
-    def get_total_estimate(task_id):
-        """Recursively get total estimate for a task (sum of all descendants)"""
-        task = task_dict.get(task_id)
-        if not task:
-            return 0
-        
-        children = children_map.get(task_id, [])
-        if not children:
-            # Leaf task - return its own estimate
-            return task.estimate or 0
-        
-        # Sum estimates from all children
-        total = 0
-        for child in children:
-            total += get_total_estimate(child.id)
-        return total
-    
-    # Update all summary tasks
-    for summary_id in summary_ids:
-        summary_task = task_dict.get(summary_id)
-        if summary_task:
-            min_start, max_end = get_date_range(summary_id)
-            if min_start and max_end:
-                summary_task.start_date = min_start
-                summary_task.end_date = max_end
-            # Calculate estimate as SUM of child estimates (not date difference)
-            summary_task.estimate = get_total_estimate(summary_id)
-            summary_task.is_summary = True
-    
-    db.session.commit()
+    if db.session.query(Project.id).filter_by(id=project_id).scalar() is None:
+        abort(404)
 
 
-def update_wbs_codes(project_id):
+def _task_cache(project_id):
     """
-    Update WBS codes for all tasks in a project.
-    Top-level tasks get "1", "2", etc.
-    Children get "1.1", "1.2", "2.1", etc.
+    Load a project's tasks once per request. The list, the id lookup dict and
+    the parent-children map live on flask.g so the mutation endpoints and
+    recalculate_hierarchy share a single SELECT instead of each re-querying.
     """
-    tasks = Task.query.filter_by(project_id=project_id).order_by(Task.order_index).all()
-    
-    # Build hierarchy
-    root_tasks = [t for t in tasks if t.parent_id is None]
+    cache = getattr(g, '_task_cache', None)
+    if cache is None or cache['project_id'] != project_id:
+        tasks = Task.query.filter_by(project_id=project_id).order_by(Task.order_index).all()
+        cache = {
+            'project_id': project_id,
+            'tasks': tasks,
+            'task_dict': {t.id: t for t in tasks},
+            'children_map': _build_children_map(tasks)
+        }
+        g._task_cache = cache
+    return cache
+
+
+def _invalidate_task_cache():
+    """Drop the per-request task cache (cached instances expire on commit)."""
+    g._task_cache = None
+
+
+def _build_children_map(tasks):
+    """Group an already-loaded task list by parent_id for in-memory hierarchy walks."""
     children_map = {}
     for t in tasks:
         if t.parent_id:
             if t.parent_id not in children_map:
                 children_map[t.parent_id] = []
             children_map[t.parent_id].append(t)
-    
-    def assign_wbs(task_list, prefix=''):
-        for idx, task in enumerate(task_list, 1):
-            wbs = f"{prefix}{idx}" if prefix else str(idx)
-            task.wbs_code = wbs
-            children = children_map.get(task.id, [])
-            if children:
-                task.is_summary = True
-                assign_wbs(children, f"{wbs}.")
-            else:
-                task.is_summary = False
-    
-    assign_wbs(root_tasks)
-    db.session.commit()
+    return children_map
+
+
+def _relevel_descendants(task, children_map):
+    """Reassign levels below a task with an iterative walk over the children map."""
+    frontier = [(child, (task.level or 0) + 1) for child in children_map.get(task.id, [])]
+    while frontier:
+        child, level = frontier.pop()
+        child.level = level
+        frontier.extend((grandchild, level + 1)
+                        for grandchild in children_map.get(child.id, []))
+
+
+def _compute_depths(task_dict, children_map):
+    """Map each task id to its depth via an iterative BFS from the roots."""
+    depths = {}
+    frontier = [t for t in task_dict.values()
+                if t.parent_id is None or t.parent_id not in task_dict]
+    for t in frontier:
+        depths[t.id] = 0
+    while frontier:
+        next_frontier = []
+        for t in frontier:
+            for child in children_map.get(t.id, []):
+                depths[child.id] = depths[t.id] + 1
+                next_frontier.append(child)
+        frontier = next_frontier
+    return depths
+
+
+def _assign_wbs(root_tasks, children_map, pending):
+    """
+    Assign WBS codes depth-first and keep is_summary in sync.
+    Top-level tasks get "1", "2", etc.; children get "1.1", "1.2", "2.1", etc.
+    Changed values are recorded in `pending` rather than written to the
+    instances, so they can be flushed in one bulk UPDATE.
+    """
+    stack = [(task, str(idx)) for idx, task in enumerate(root_tasks, 1)]
+    while stack:
+        task, wbs = stack.pop()
+        if task.wbs_code != wbs:
+            pending[task.id]['wbs_code'] = wbs
+        children = children_map.get(task.id, [])
+        if bool(task.is_summary) != bool(children):
+            pending[task.id]['is_summary'] = bool(children)
+        stack.extend((child, f"{wbs}.{idx}") for idx, child in enumerate(children, 1))
+
 
+def _assign_order(root_tasks, children_map, pending):
+    """Renumber order_index in depth-first pre-order using an explicit stack."""
+    counter = 0
+    stack = list(reversed(root_tasks))
+    while stack:
+        task = stack.pop()
+        if task.order_index != counter:
+            pending[task.id]['order_index'] = counter
+        counter += 1
+        stack.extend(reversed(children_map.get(task.id, [])))
 
-def recalculate_order_indices(project_id):
+
+def _recompute_dates(children_map, task_dict, pending):
     """
-    Recalculate order_index for all tasks to maintain proper tree order.
-    Uses depth-first traversal to assign indices.
+    Bottom-up recalculation of summary task dates and estimates in a single
+    sweep. Summary tasks are processed deepest-first, so each task's children
+    already hold their final values when the task itself is visited:
+    - start_date = MIN(children.start_date)
+    - end_date = MAX(children.end_date)
+    - estimate = SUM(children.estimate)
     """
-    tasks = Task.query.filter_by(project_id=project_id).order_by(Task.order_index).all()
-    
-    # Build hierarchy
-    root_tasks = [t for t in tasks if t.parent_id is None]
-    children_map = {}
-    for t in tasks:
-        if t.parent_id:
-            if t.parent_id not in children_map:
-                children_map[t.parent_id] = []
-            children_map[t.parent_id].append(t)
-    
-    # Sort children by current order_index
-    for children in children_map.values():
-        children.sort(key=lambda x: x.order_index)
-    root_tasks.sort(key=lambda x: x.order_index)
-    
-    def assign_order(task_list, counter=0):
-        for task in task_list:
-            task.order_index = counter
-            counter += 1
-            children = children_map.get(task.id, [])
-            if children:
-                counter = assign_order(children, counter)
-        return counter
-    
-    assign_order(root_tasks)
-    db.session.commit()
+    if not children_map:
+        return
+
+    depths = _compute_depths(task_dict, children_map)
 
+    def value(t, key):
+        return pending[t.id].get(key, getattr(t, key))
 
-def recalculate_summary_status(project_id):
+    # Deepest summary tasks first; dates calculated PURELY from children
+    for summary_id in sorted(children_map, key=lambda tid: -depths.get(tid, 0)):
+        summary_task = task_dict.get(summary_id)
+        if not summary_task:
+            continue
+        children = children_map[summary_id]
+        starts = [value(c, 'start_date') for c in children if value(c, 'start_date')]
+        ends = [value(c, 'end_date') for c in children if value(c, 'end_date')]
+        changes = pending[summary_id]
+        if starts and ends:
+            min_start, max_end = min(starts), max(ends)
+            if summary_task.start_date != min_start:
+                changes['start_date'] = min_start
+            if summary_task.end_date != max_end:
+                changes['end_date'] = max_end
+        # Calculate estimate as SUM of child estimates (not date difference)
+        estimate = sum(value(c, 'estimate') or 0 for c in children)
+        if summary_task.estimate != estimate:
+            changes['estimate'] = estimate
+
+
+def _recompute_status(children_map, task_dict, pending):
     """
-    Recalculate status for summary tasks based on children status.
+    Recalculate status for summary tasks based on children status, visiting
+    the deepest summaries first so child statuses are already final.
     Rules:
     - If any child is "In Progress", parent becomes "In Progress"
     - If all children are "Complete", parent becomes "Complete"
     - If all children are "Not Started", parent stays "Not Started"
     """
-    tasks = Task.query.filter_by(project_id=project_id).all()
-    
-    # Build hierarchy
-    children_map = {}
-    for t in tasks:
-        if t.parent_id:
-            if t.parent_id not in children_map:
-                children_map[t.parent_id] = []
-            children_map[t.parent_id].append(t)
-    
-    # Process summary tasks (bottom-up by traversing children first - handled by recursion)
-    def update_parent_status(task):
-        children = children_map.get(task.id, [])
-        if not children:
-            return
-        
-        # First update nested children
-        for child in children:
-            update_parent_status(child)
-        
-        # Get child statuses
-        child_statuses = [c.status for c in children]
-        
+    if not children_map:
+        return
+
+    depths = _compute_depths(task_dict, children_map)
+
+    def value(t):
+        return pending[t.id].get('status', t.status)
+
+    for summary_id in sorted(children_map, key=lambda tid: -depths.get(tid, 0)):
+        task = task_dict.get(summary_id)
+        if not task:
+            continue
+
+        child_statuses = [value(c) for c in children_map[summary_id]]
+
         # Determine parent status based on children
         if 'In Progress' in child_statuses:
-            task.status = 'In Progress'
+            status = 'In Progress'
         elif all(s == 'Complete' for s in child_statuses):
-            task.status = 'Complete'
+            status = 'Complete'
         elif all(s == 'Not Started' for s in child_statuses):
-            task.status = 'Not Started'
+            status = 'Not Started'
         else:
             # Mixed status (some complete, some not started) - set to In Progress
-            task.status = 'In Progress'
-    
-    # Process all root tasks
-    root_tasks = [t for t in tasks if t.parent_id is None]
-    for task in root_tasks:
-        update_parent_status(task)
-    
+            status = 'In Progress'
+
+        if task.status != status:
+            pending[summary_id]['status'] = status
+
+
+def recalculate_hierarchy(project_id):
+    """
+    Single-pass recalculation of a project's WBS hierarchy.
+
+    Works off the request's cached task list (one SELECT per request) and
+    computes WBS codes, order indices, summary dates/estimates and summary
+    statuses into a per-task change set instead of dirtying the instances.
+    The accumulated changes go to the database through one
+    bulk_update_mappings executemany, followed by exactly one commit.
+    Returns the serialized rows in final tree order, so callers don't need
+    to re-query for their response.
+    """
+    cache = _task_cache(project_id)
+    tasks = cache['tasks']
+    task_dict = cache['task_dict']
+
+    # Rebuild the children map: callers may have re-parented tasks since the
+    # cache was populated
+    children_map = _build_children_map(tasks)
+    cache['children_map'] = children_map
+
+    # Sort siblings by current order_index so traversal preserves relative order
+    for children in children_map.values():
+        children.sort(key=lambda x: x.order_index)
+    root_tasks = sorted((t for t in tasks if t.parent_id is None), key=lambda x: x.order_index)
+
+    pending = {t.id: {} for t in tasks}
+    _assign_wbs(root_tasks, children_map, pending)
+    _assign_order(root_tasks, children_map, pending)
+    _recompute_dates(children_map, task_dict, pending)
+    _recompute_status(children_map, task_dict, pending)
+
+    # Serialize instance state plus the pending changes, in final tree order
+    rows = Task.rows_to_dicts(tasks)
+    for row in rows:
+        row.update(pending[row['id']])
+    rows.sort(key=lambda r: r['order_index'])
+
+    # Flush the recalculated fields in a single executemany UPDATE; any
+    # fields the endpoint mutated directly still flush through the unit of
+    # work on commit
+    mappings = [{'id': task_id, **changes} for task_id, changes in pending.items() if changes]
+    if mappings:
+        db.session.bulk_update_mappings(Task, mappings)
     db.session.commit()
+    _invalidate_task_cache()
+    return rows
 
 
 # =============================================================================
@@ -374,8 +668,38 @@ def recalculate_summary_status(project_id):
 @app.route('/api/projects', methods=['GET'])
 def get_projects():
     """Get all projects"""
-    projects = Project.query.all()
-    return jsonify([p.to_dict() for p in projects])
+    # One grouped outer join returns the project columns and the task
+    # aggregates together — no ORM hydration and no second summary query,
+    # so Python work per project row is constant.
+    p = Project.__table__.c
+    stmt = (
+        select(p.id, p.name, p.description, p.code, p.created_at,
+               func.count(Task.id).label('task_count'),
+               func.sum(Task.estimate).label('total_estimate'),
+               func.sum(Task.estimate * Task.progress / 100.0).label('completed_estimate'),
+               func.min(Task.start_date).label('start_date'),
+               func.max(Task.end_date).label('end_date'))
+        .outerjoin(Task, Task.__table__.c.project_id == p.id)
+        .group_by(p.id)
+    )
+    projects = []
+    for r in db.session.execute(stmt).mappings():
+        total_estimate = r['total_estimate'] or 0
+        completed_estimate = r['completed_estimate'] or 0
+        projects.append({
+            'id': r['id'],
+            'name': r['name'],
+            'description': r['description'],
+            'code': r['code'],
+            'created_at': r['created_at'],
+            'task_count': r['task_count'],
+            'total_estimate': round(total_estimate, 1),
+            'completed_estimate': round(completed_estimate, 1),
+            'progress': round(completed_estimate / total_estimate * 100) if total_estimate > 0 else 0,
+            'start_date': r['start_date'],
+            'end_date': r['end_date']
+        })
+    return jsonify(projects)
 
 
 @app.route('/api/projects', methods=['POST'])
@@ -428,6 +752,9 @@ def update_project(project_id):
 def delete_project(project_id):
     """Delete a project and all its tasks"""
     project = Project.query.get_or_404(project_id)
+    # One bulk DELETE for the tasks instead of loading each row into the
+    # session and deleting it individually
+    Task.query.filter_by(project_id=project_id).delete(synchronize_session=False)
     db.session.delete(project)
     db.session.commit()
     return jsonify({'message': 'Project deleted successfully'})
@@ -439,10 +766,23 @@ def delete_project(project_id):
 
 @app.route('/api/projects/<int:project_id>/tasks', methods=['GET'])
 def get_tasks(project_id):
-    """Get all tasks for a project"""
-    project = Project.query.get_or_404(project_id)
-    tasks = Task.query.filter_by(project_id=project_id).order_by(Task.order_index).all()
-    return jsonify([t.to_dict() for t in tasks])
+    """Stream all tasks for a project as a JSON array.
+
+    Rows are encoded and written as they come off the cursor (in 500-row
+    fetch batches), so time-to-first-byte and peak memory stay flat no
+    matter how large the project grows.
+    """
+    _require_project(project_id)
+
+    def generate():
+        yield b'['
+        sep = b''
+        for row in _iter_task_rows(project_id):
+            yield sep + orjson.dumps(row)
+            sep = b','
+        yield b']'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 
 @app.route('/api/projects/<int:project_id>/tasks', methods=['POST'])
@@ -450,14 +790,22 @@ def create_task(project_id):
     """Create a new task with auto-generated ID. Supports creating as a child of another task."""
     project = Project.query.get_or_404(project_id)
     data = request.get_json()
-    
-    # Generate unique task ID (e.g., MIG-001)
-    task_count = Task.query.filter_by(project_id=project_id).count()
-    task_id = f"{project.code}-{str(task_count + 1).zfill(3)}"
-    
-    # Parse dates
-    start_date = datetime.strptime(data['start_date'], '%Y-%m-%d').date()
-    end_date = datetime.strptime(data['end_date'], '%Y-%m-%d').date()
+
+    # Generate unique task ID (e.g., MIG-001) from the project's counter.
+    # The increment is a single atomic UPDATE ... RETURNING, so concurrent
+    # creates each get a distinct sequence number without an O(N) COUNT
+    # over the project's tasks.
+    seq = db.session.execute(
+        update(Project.__table__)
+        .where(Project.id == project_id)
+        .values(next_task_seq=func.coalesce(Project.next_task_seq, 0) + 1)
+        .returning(Project.next_task_seq)
+    ).scalar_one()
+    task_id = f"{project.code}-{str(seq).zfill(3)}"
+    
+    # Parse dates (fromisoformat is the fast C path for YYYY-MM-DD strings)
+    start_date = date.fromisoformat(data['start_date'])
+    end_date = date.fromisoformat(data['end_date'])
     
     # Validate end_date >= start_date
     if end_date < start_date:
@@ -466,7 +814,7 @@ def create_task(project_id):
     # Handle hierarchical parent (for creating child tasks)
     parent_id = data.get('parent_id')
     level = 0
-    order_index = task_count  # Default: add at end
+    order_index = seq - 1  # Sorts after existing tasks; renumbered by recalculate_hierarchy
     
     if parent_id:
         parent_task = Task.query.get(parent_id)
@@ -513,18 +861,65 @@ def create_task(project_id):
         level=level
     )
     db.session.add(task)
-    db.session.commit()
-    
-    # Recalculate hierarchy
-    update_wbs_codes(project_id)
-    recalculate_order_indices(project_id)
-    if parent_id:
-        recalculate_summary_dates(project_id)
-    
-    # Return all tasks to reflect hierarchy changes
-    all_tasks = Task.query.filter_by(project_id=project_id).order_by(Task.order_index).all()
-    return jsonify([t.to_dict() for t in all_tasks]), 201
+    db.session.flush()  # Assign task.id so the hierarchy pass can see it
+
+    # Recalculate hierarchy (commits once) and return all tasks to reflect
+    # the changes
+    return jsonify(recalculate_hierarchy(project_id)), 201
+
 
+@app.route('/api/projects/<int:project_id>/tasks/bulk', methods=['POST'])
+def create_tasks_bulk(project_id):
+    """Import many tasks in one request and one transaction.
+
+    Accepts {"tasks": [...]} where each entry takes the same fields as the
+    single-task endpoint (minus parent_id — imported rows are appended at the
+    top level). Rows are inserted with a single executemany INSERT and the
+    hierarchy pass commits once, instead of one commit/fsync per task.
+    """
+    project = Project.query.get_or_404(project_id)
+    data = request.get_json()
+    items = data.get('tasks') if data else None
+    if not items or not isinstance(items, list):
+        return jsonify({'error': 'tasks must be a non-empty list'}), 400
+
+    # Reserve a contiguous block of task IDs from the project counter in
+    # one atomic UPDATE ... RETURNING
+    top = db.session.execute(
+        update(Project.__table__)
+        .where(Project.id == project_id)
+        .values(next_task_seq=func.coalesce(Project.next_task_seq, 0) + len(items))
+        .returning(Project.next_task_seq)
+    ).scalar_one()
+    base = top - len(items)
+
+    rows = []
+    for i, item in enumerate(items):
+        start_date = date.fromisoformat(item['start_date'])
+        end_date = date.fromisoformat(item['end_date'])
+        if end_date < start_date:
+            return jsonify({'error': f'End date must be after start date (task {i + 1})'}), 400
+        rows.append({
+            'task_id': f"{project.code}-{str(base + i + 1).zfill(3)}",
+            'description': item.get('description', ''),
+            'start_date': start_date,
+            'end_date': end_date,
+            'estimate': item.get('estimate', 0.0),
+            'resource': item.get('resource'),
+            'status': item.get('status', 'Not Started'),
+            'task_type': item.get('task_type', 'Task'),
+            'parent_ids': item.get('parent_ids'),
+            'progress': item.get('progress', 0),
+            'project_id': project_id,
+            'order_index': base + i,
+            'parent_id': None,
+            'level': 0,
+        })
+
+    db.session.execute(Task.__table__.insert(), rows)
+
+    # Recalculate hierarchy (commits once, covering the inserts too)
+    return jsonify(recalculate_hierarchy(project_id)), 201
 
 
 @app.route('/api/tasks/<int:task_id>', methods=['GET'])
@@ -534,11 +929,71 @@ def get_task(task_id):
     return jsonify(task.to_dict())
 
 
+# Drag-to-reorder and expand/collapse hammer update_task with edits to
+# fields that never feed the hierarchy rollups. Those writes are handed to
+# a single daemon writer thread that coalesces queued changes per task and
+# flushes them in one transaction, so the request thread answers without
+# waiting on a commit/fsync. Every other mutation stays synchronous for
+# read-your-writes semantics.
+_WRITE_BEHIND_FIELDS = frozenset(('order_index', 'expanded'))
+_write_queue = queue.Queue()
+
+
+def _write_behind_worker():
+    """Drain queued task field updates and commit them in batches."""
+    while True:
+        task_id, changes = _write_queue.get()
+        pending = {task_id: dict(changes)}
+        drained = 1
+        # Coalesce everything already queued into the same transaction;
+        # later changes to the same task win
+        while True:
+            try:
+                more_id, more = _write_queue.get_nowait()
+            except queue.Empty:
+                break
+            pending.setdefault(more_id, {}).update(more)
+            drained += 1
+        # Known race: a queued order_index can land after a synchronous
+        # /reorder + recalculate_hierarchy has renumbered the column and
+        # overwrite the fresh value; the next reorder self-heals it.
+        with app.app_context():
+            try:
+                for tid, pending_changes in pending.items():
+                    db.session.execute(
+                        update(Task.__table__)
+                        .where(Task.__table__.c.id == tid)
+                        .values(**pending_changes)
+                    )
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                # The client already got a 202 for these changes, so a
+                # dropped batch must at least leave a trace
+                app.logger.exception('write-behind flush failed; dropped %r', pending)
+            finally:
+                db.session.remove()
+        for _ in range(drained):
+            _write_queue.task_done()
+
+
+threading.Thread(target=_write_behind_worker, daemon=True).start()
+
+
 @app.route('/api/tasks/<int:task_id>', methods=['PUT'])
 def update_task(task_id):
     """Update a task. Summary tasks have read-only dates."""
     task = Task.query.get_or_404(task_id)
     data = request.get_json()
+
+    # Write-behind fast path: pure cosmetic edits are queued for the writer
+    # thread and answered optimistically with 202 Accepted
+    if data and set(data) <= _WRITE_BEHIND_FIELDS:
+        payload = task.to_dict()
+        payload.update(data)
+        _write_queue.put((task_id, dict(data)))
+        return jsonify(payload), 202
+
     project_id = task.project_id
     dates_changed = False
     
@@ -548,10 +1003,10 @@ def update_task(task_id):
     # Only allow date changes for non-summary tasks
     if not task.is_summary:
         if 'start_date' in data:
-            task.start_date = datetime.strptime(data['start_date'], '%Y-%m-%d').date()
+            task.start_date = date.fromisoformat(data['start_date'])
             dates_changed = True
         if 'end_date' in data:
-            task.end_date = datetime.strptime(data['end_date'], '%Y-%m-%d').date()
+            task.end_date = date.fromisoformat(data['end_date'])
             dates_changed = True
         if 'estimate' in data:
             task.estimate = data['estimate']
@@ -568,7 +1023,7 @@ def update_task(task_id):
     if 'parent_ids' in data:
         task.parent_ids = data['parent_ids']
     if 'progress' in data:
-        task.progress = max(0, min(100, data['progress']))  # Clamp 0-100
+        task.progress = int(data['progress'])  # Range enforced by ck_task_progress
     if 'order_index' in data:
         task.order_index = data['order_index']
     if 'expanded' in data:
@@ -615,28 +1070,35 @@ def update_task(task_id):
     if not task.is_summary and task.end_date < task.start_date:
         return jsonify({'error': 'End date must be after start date'}), 400
     
-    db.session.commit()
-    
-    # Recalculate hierarchy if parent changed
-    if parent_changed:
-        update_wbs_codes(project_id)
-        recalculate_order_indices(project_id)
-        recalculate_summary_dates(project_id)
-    
-    # Recalculate parent summary tasks if dates OR estimates changed
-    if dates_changed or estimate_changed:
-        recalculate_summary_dates(project_id)
-    
-    # Recalculate parent status if this task's status changed
+    # Recalculate in one pass if anything that rolls up changed. A top-level
+    # leaf has no ancestors to roll into, so plain date/estimate/status edits
+    # on it don't need a project-wide recalculation. A top-level summary is
+    # different: its status is derived from its children, so a direct edit
+    # must go through the recalculation to be re-derived rather than persist.
     status_changed = 'status' in data
-    if status_changed:
-        recalculate_summary_status(project_id)
-    
-    # Return all tasks if hierarchy, dates, estimate, or status changed
-    if parent_changed or dates_changed or estimate_changed or status_changed:
+    rollup_changed = dates_changed or estimate_changed or status_changed
+    needs_recalc = parent_changed or (
+        rollup_changed and (task.parent_id is not None or task.is_summary))
+
+    if needs_recalc:
+        try:
+            # Flushes the pending edits, commits once and returns the full list
+            return jsonify(recalculate_hierarchy(project_id))
+        except IntegrityError:
+            db.session.rollback()
+            return jsonify({'error': 'Progress must be between 0 and 100'}), 400
+
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({'error': 'Progress must be between 0 and 100'}), 400
+
+    # Return all tasks if dates, estimate, or status changed (top-level leaf)
+    if rollup_changed:
         all_tasks = Task.query.filter_by(project_id=project_id).order_by(Task.order_index).all()
-        return jsonify([t.to_dict() for t in all_tasks])
-    
+        return jsonify(Task.rows_to_dicts(all_tasks))
+
     return jsonify(task.to_dict())
 
 
@@ -646,26 +1108,24 @@ def delete_task(task_id):
     task = Task.query.get_or_404(task_id)
     project_id = task.project_id
     
+    # Use the request's task cache to walk the hierarchy in memory
+    children_map = _task_cache(project_id)['children_map']
+
     # Move children up one level (to deleted task's parent)
-    children = Task.query.filter_by(parent_id=task_id).all()
-    for child in children:
+    for child in children_map.get(task_id, []):
         child.parent_id = task.parent_id
         if task.parent_id:
             child.level = task.level
         else:
             child.level = 0
-    
+
     db.session.delete(task)
-    db.session.commit()
-    
-    # Recalculate hierarchy
-    update_wbs_codes(project_id)
-    recalculate_summary_dates(project_id)
-    recalculate_order_indices(project_id)
-    
-    # Return updated task list
-    tasks = Task.query.filter_by(project_id=project_id).order_by(Task.order_index).all()
-    return jsonify([t.to_dict() for t in tasks])
+    # The cached list still contains the deleted task; reload before recalculating
+    _invalidate_task_cache()
+
+    # Recalculate hierarchy (flushes the delete, commits once) and return the
+    # updated task list
+    return jsonify(recalculate_hierarchy(project_id))
 
 
 # =============================================================================
@@ -681,8 +1141,9 @@ def indent_task(task_id):
     task = Task.query.get_or_404(task_id)
     project_id = task.project_id
     
-    # Find the task immediately above this one
-    tasks = Task.query.filter_by(project_id=project_id).order_by(Task.order_index).all()
+    # Find the task immediately above this one (request-scoped task cache)
+    cache = _task_cache(project_id)
+    tasks = cache['tasks']
     task_index = next((i for i, t in enumerate(tasks) if t.id == task_id), -1)
     
     if task_index <= 0:
@@ -702,26 +1163,14 @@ def indent_task(task_id):
     task.parent_id = potential_parent.id
     task.level = potential_parent.level + 1
     potential_parent.is_summary = True
-    
-    # Also indent all children (descendants) of this task
-    def update_descendants(parent_task, level_offset):
-        children = Task.query.filter_by(parent_id=parent_task.id).all()
-        for child in children:
-            child.level = parent_task.level + 1
-            update_descendants(child, level_offset)
-    
-    update_descendants(task, 1)
-    
-    db.session.commit()
-    
-    # Recalculate everything
-    update_wbs_codes(project_id)
-    recalculate_summary_dates(project_id)
-    recalculate_order_indices(project_id)
-    
-    # Return updated task list
-    tasks = Task.query.filter_by(project_id=project_id).order_by(Task.order_index).all()
-    return jsonify([t.to_dict() for t in tasks])
+
+    # Also indent all children (descendants) of this task; the cached map
+    # still reflects their (unchanged) subtree structure
+    _relevel_descendants(task, cache['children_map'])
+
+    # Recalculate everything in one pass (commits once) and return the
+    # updated task list
+    return jsonify(recalculate_hierarchy(project_id))
 
 
 @app.route('/api/tasks/<int:task_id>/outdent', methods=['POST'])
@@ -745,7 +1194,7 @@ def outdent_task(task_id):
     task.level = old_parent.level
     
     # Find siblings that were below this task and make them children of this task
-    all_tasks = Task.query.filter_by(project_id=project_id).order_by(Task.order_index).all()
+    all_tasks = _task_cache(project_id)['tasks']
     task_index = next((i for i, t in enumerate(all_tasks) if t.id == task_id), -1)
     
     # Siblings that come after this task (with same original parent) become children
@@ -758,30 +1207,17 @@ def outdent_task(task_id):
         elif sibling.level <= old_parent.level:
             break  # Stop when we reach a task at same or higher level as old parent
     
-    # Update descendants' levels
-    def update_descendants(parent_task):
-        children = Task.query.filter_by(parent_id=parent_task.id).all()
-        for child in children:
-            child.level = parent_task.level + 1
-            update_descendants(child)
-    
-    update_descendants(task)
-    
+    # Update descendants' levels from the in-memory map (built after re-parenting)
+    children_map = _build_children_map(all_tasks)
+    _relevel_descendants(task, children_map)
+
     # Check if old parent still has children
-    old_parent_children = Task.query.filter_by(parent_id=old_parent.id).count()
-    if old_parent_children == 0:
+    if not children_map.get(old_parent.id):
         old_parent.is_summary = False
-    
-    db.session.commit()
-    
-    # Recalculate everything
-    update_wbs_codes(project_id)
-    recalculate_summary_dates(project_id)
-    recalculate_order_indices(project_id)
-    
-    # Return updated task list
-    tasks = Task.query.filter_by(project_id=project_id).order_by(Task.order_index).all()
-    return jsonify([t.to_dict() for t in tasks])
+
+    # Recalculate everything in one pass (commits once) and return the
+    # updated task list
+    return jsonify(recalculate_hierarchy(project_id))
 
 
 @app.route('/api/tasks/<int:task_id>/toggle-expand', methods=['POST'])
@@ -804,25 +1240,31 @@ def reorder_tasks(project_id):
     Reorder tasks based on new order_index values.
     Used for drag-and-drop reordering.
     """
-    Project.query.get_or_404(project_id)
+    _require_project(project_id)
     data = request.get_json()
     
     task_orders = data.get('task_orders', [])  # List of {id: number, order_index: number}
-    
-    for item in task_orders:
-        task = Task.query.get(item['id'])
-        if task and task.project_id == project_id:
-            task.order_index = item['order_index']
-    
-    db.session.commit()
-    
-    # Recalculate WBS codes and dates
-    update_wbs_codes(project_id)
-    recalculate_summary_dates(project_id)
-    
-    # Return updated task list
-    tasks = Task.query.filter_by(project_id=project_id).order_by(Task.order_index).all()
-    return jsonify([t.to_dict() for t in tasks])
+
+    # Prefetch the project's matching task ids in one IN query, then apply
+    # the new positions with a single executemany UPDATE; stale or foreign
+    # ids in the payload are dropped instead of binding no-op statements
+    if task_orders:
+        requested_ids = [int(item['id']) for item in task_orders]
+        valid_ids = {row[0] for row in db.session.query(Task.id).filter(
+            Task.id.in_(requested_ids), Task.project_id == project_id)}
+        values = [{'b_id': int(item['id']), 'b_order': int(item['order_index'])}
+                  for item in task_orders if int(item['id']) in valid_ids]
+        if values:
+            db.session.execute(
+                update(Task.__table__)
+                .where(Task.id == bindparam('b_id'))
+                .values(order_index=bindparam('b_order')),
+                values
+            )
+
+    # Recalculate WBS codes, order and dates in one pass and return the
+    # updated task list
+    return jsonify(recalculate_hierarchy(project_id))
 
 
 # =============================================================================
@@ -832,22 +1274,24 @@ def reorder_tasks(project_id):
 @app.route('/api/settings', methods=['GET'])
 def get_settings():
     """Get all settings (resources, statuses, task types)"""
-    resources = Resource.query.all()
-    statuses = Status.query.order_by(Status.order_index).all()
-    task_types = TaskType.query.all()
-    
-    return jsonify({
-        'resources': [r.to_dict() for r in resources],
-        'statuses': [s.to_dict() for s in statuses],
-        'task_types': [t.to_dict() for t in task_types]
-    })
+    v = _settings_versions
+    key = ('settings', v['resource'], v['status'], v['task_type'])
+
+    def build():
+        resources, statuses, task_types = _settings_rows()
+        return {
+            'resources': resources,
+            'statuses': statuses,
+            'task_types': task_types
+        }
+
+    return _cached_json(key, build)
 
 
 @app.route('/api/resources', methods=['GET'])
 def get_resources():
     """Get all resources"""
-    resources = Resource.query.all()
-    return jsonify([r.to_dict() for r in resources])
+    return _cached_json(('resources', _settings_versions['resource']), _resource_rows)
 
 
 @app.route('/api/resources', methods=['POST'])
@@ -859,9 +1303,9 @@ def create_resource():
     availability_start = None
     availability_end = None
     if data.get('availability_start'):
-        availability_start = datetime.strptime(data['availability_start'], '%Y-%m-%d').date()
+        availability_start = date.fromisoformat(data['availability_start'])
     if data.get('availability_end'):
-        availability_end = datetime.strptime(data['availability_end'], '%Y-%m-%d').date()
+        availability_end = date.fromisoformat(data['availability_end'])
     
     resource = Resource(
         name=data['name'],
@@ -873,6 +1317,7 @@ def create_resource():
     )
     db.session.add(resource)
     db.session.commit()
+    _bump_settings_version('resource')
     return jsonify(resource.to_dict()), 201
 
 
@@ -890,18 +1335,19 @@ def update_resource(resource_id):
         resource.color = data['color']
     if 'availability_start' in data:
         if data['availability_start']:
-            resource.availability_start = datetime.strptime(data['availability_start'], '%Y-%m-%d').date()
+            resource.availability_start = date.fromisoformat(data['availability_start'])
         else:
             resource.availability_start = None
     if 'availability_end' in data:
         if data['availability_end']:
-            resource.availability_end = datetime.strptime(data['availability_end'], '%Y-%m-%d').date()
+            resource.availability_end = date.fromisoformat(data['availability_end'])
         else:
             resource.availability_end = None
     if 'allocation_percent' in data:
         resource.allocation_percent = max(1, min(100, data['allocation_percent']))
     
     db.session.commit()
+    _bump_settings_version('resource')
     return jsonify(resource.to_dict())
 
 
@@ -911,14 +1357,14 @@ def delete_resource(resource_id):
     resource = Resource.query.get_or_404(resource_id)
     db.session.delete(resource)
     db.session.commit()
+    _bump_settings_version('resource')
     return jsonify({'message': 'Resource deleted successfully'})
 
 
 @app.route('/api/statuses', methods=['GET'])
 def get_statuses():
     """Get all statuses"""
-    statuses = Status.query.order_by(Status.order_index).all()
-    return jsonify([s.to_dict() for s in statuses])
+    return _cached_json(('statuses', _settings_versions['status']), _status_rows)
 
 
 @app.route('/api/statuses', methods=['POST'])
@@ -932,6 +1378,7 @@ def create_status():
     )
     db.session.add(status)
     db.session.commit()
+    _bump_settings_version('status')
     return jsonify(status.to_dict()), 201
 
 
@@ -949,6 +1396,7 @@ def update_status(status_id):
         status.order_index = data['order_index']
     
     db.session.commit()
+    _bump_settings_version('status')
     return jsonify(status.to_dict())
 
 
@@ -958,14 +1406,14 @@ def delete_status(status_id):
     status = Status.query.get_or_404(status_id)
     db.session.delete(status)
     db.session.commit()
+    _bump_settings_version('status')
     return jsonify({'message': 'Status deleted successfully'})
 
 
 @app.route('/api/task-types', methods=['GET'])
 def get_task_types():
     """Get all task types"""
-    task_types = TaskType.query.all()
-    return jsonify([t.to_dict() for t in task_types])
+    return _cached_json(('task_types', _settings_versions['task_type']), _task_type_rows)
 
 
 @app.route('/api/task-types', methods=['POST'])
@@ -975,6 +1423,7 @@ def create_task_type():
     task_type = TaskType(name=data['name'])
     db.session.add(task_type)
     db.session.commit()
+    _bump_settings_version('task_type')
     return jsonify(task_type.to_dict()), 201
 
 
@@ -985,7 +1434,51 @@ def create_task_type():
 def init_db():
     """Initialize database with default settings"""
     db.create_all()
-    
+
+    # Lightweight migration for databases created before next_task_seq existed:
+    # backfill the counter from the highest task ID suffix already handed out
+    project_columns = [row[1] for row in db.session.execute(db.text('PRAGMA table_info(project)'))]
+    if 'next_task_seq' not in project_columns:
+        db.session.execute(db.text('ALTER TABLE project ADD COLUMN next_task_seq INTEGER DEFAULT 0'))
+        db.session.execute(db.text(
+            'UPDATE project SET next_task_seq = COALESCE('
+            '(SELECT MAX(CAST(substr(task.task_id, length(project.code) + 2) AS INTEGER)) '
+            'FROM task WHERE task.project_id = project.id), 0)'
+        ))
+
+    # Rebuild the task table on databases created before ck_task_progress:
+    # SQLite cannot add a CHECK constraint in place, so clamp any legacy
+    # out-of-range rows, move the table aside, recreate it from the model
+    # (picking up the constraint, NOT NULL progress and the CASCADE foreign
+    # key) and copy the rows across. DDL is transactional in SQLite, so a
+    # failure rolls the whole rebuild back.
+    task_ddl = db.session.execute(db.text(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'task'"
+    )).scalar()
+    if task_ddl and 'ck_task_progress' not in task_ddl:
+        db.session.execute(db.text(
+            'UPDATE task SET progress = MAX(0, MIN(100, COALESCE(progress, 0)))'
+        ))
+        db.session.execute(db.text('ALTER TABLE task RENAME TO task_old'))
+        for index_name in ('ix_task_project_order', 'ix_task_project_parent', 'ix_task_parent'):
+            db.session.execute(db.text(f'DROP INDEX IF EXISTS {index_name}'))
+        Task.__table__.create(db.session.connection())
+        columns = ', '.join(c.name for c in Task.__table__.columns)
+        db.session.execute(db.text(
+            f'INSERT INTO task ({columns}) SELECT {columns} FROM task_old'
+        ))
+        db.session.execute(db.text('DROP TABLE task_old'))
+
+    # create_all only creates missing tables, so make sure the task indexes
+    # also exist on databases created before they were declared
+    for index_sql in (
+        'CREATE INDEX IF NOT EXISTS ix_task_project_order ON task (project_id, order_index)',
+        'CREATE INDEX IF NOT EXISTS ix_task_project_parent ON task (project_id, parent_id)',
+        'CREATE INDEX IF NOT EXISTS ix_task_parent ON task (parent_id)',
+        'CREATE INDEX IF NOT EXISTS ix_status_order_index ON status (order_index)',
+    ):
+        db.session.execute(db.text(index_sql))
+
     # Add default statuses if none exist
     if Status.query.count() == 0:
         default_statuses = [
@@ -995,14 +1488,14 @@ def init_db():
             {'name': 'Completed', 'color': '#4CAF50', 'order_index': 3},
             {'name': 'Cancelled', 'color': '#F44336', 'order_index': 4}
         ]
-        for s in default_statuses:
-            db.session.add(Status(**s))
+        # Core executemany: one batched INSERT, no per-row RETURNING or
+        # unit-of-work bookkeeping (same pattern as the bulk task endpoint)
+        db.session.execute(Status.__table__.insert(), default_statuses)
     
     # Add default task types if none exist
     if TaskType.query.count() == 0:
         default_types = ['Task', 'Milestone']
-        for t in default_types:
-            db.session.add(TaskType(name=t))
+        db.session.execute(TaskType.__table__.insert(), [{'name': t} for t in default_types])
     
     db.session.commit()
 